@@ -55,7 +55,7 @@ def init(
         json.dump(config, f, indent=2)
     
     # Create sample Python smart contract
-    python_contract = '''from avax_cli.py_contracts import PySmartContract
+    python_contract = '''from avax_cli.py_contracts import PySmartContract, public_function, view_function
 
 class SimpleStorage(PySmartContract):
     """Simple storage contract written in Python."""
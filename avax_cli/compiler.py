@@ -3,11 +3,12 @@
 import json
 import shutil
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 
 from solcx import compile_standard, install_solc, set_solc_version
 from rich.console import Console
 
+from .json_io import load_json_cached
 from .transpiler import transpile_python_contract
 
 console = Console()
@@ -237,6 +238,31 @@ def compile_contracts(
     return results
 
 
+def get_contract_abi(contract_name: str, build_dir: Path = Path("build")) -> List[Dict[str, Any]]:
+    """
+    Load only the ABI of a compiled contract.
+    
+    Reads the ABI-only file written next to the full artifact, so the
+    bytecode and metadata are never parsed.
+    
+    Args:
+        contract_name: Name of the contract
+        build_dir: Build directory containing artifacts
+    
+    Returns:
+        Contract ABI
+    """
+    abi_file = build_dir / contract_name / f"{contract_name}_abi.json"
+    
+    if not abi_file.exists():
+        raise FileNotFoundError(
+            f"Contract artifacts not found for {contract_name}. "
+            f"Run 'avax-cli compile' first."
+        )
+    
+    return load_json_cached(abi_file)
+
+
 def get_contract_artifacts(contract_name: str, build_dir: Path = Path("build")) -> Dict[str, Any]:
     """
     Load compiled contract artifacts.
@@ -257,8 +283,7 @@ def get_contract_artifacts(contract_name: str, build_dir: Path = Path("build"))
             f"Run 'avax-cli compile' first."
         )
     
-    with open(artifact_file) as f:
-        artifacts = json.load(f)
+    artifacts = load_json_cached(artifact_file)
     
     return {
         "abi": artifacts["abi"],
@@ -1,49 +1,88 @@
 """Smart contract deployment to Avalanche C-Chain."""
 
 import json
+import os
 import time
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from web3 import Web3
 # Web3 middleware no longer needed for Avalanche C-Chain
 from rich.console import Console
 
 from .compiler import get_contract_artifacts
+from .json_io import load_json
 from .wallet import WalletManager
 
 console = Console()
 
+# rpc_url -> connected Web3, so deploy/estimate/interact share one session
+_CONNECTIONS: Dict[str, Web3] = {}
+
+
+def _make_session() -> requests.Session:
+    """Create an HTTP session with keep-alive pooling and light retries."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(total=2, backoff_factor=0.3)
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
 
 def get_web3_connection(config: Dict[str, Any]) -> Web3:
     """
     Create Web3 connection to Avalanche RPC.
     
+    Connections are cached per RPC URL, so later calls in the same process
+    reuse the pooled TLS session and skip the connectivity checks.
+    
     Args:
         config: Configuration dictionary with RPC URL and chain ID
     
     Returns:
         Configured Web3 instance
     """
-    w3 = Web3(Web3.HTTPProvider(config["rpc_url"]))
+    rpc_url = config["rpc_url"]
+    w3 = _CONNECTIONS.get(rpc_url)
+    if w3 is not None:
+        return w3
+    
+    w3 = Web3(Web3.HTTPProvider(
+        rpc_url,
+        session=_make_session(),
+        request_kwargs={"timeout": 30}
+    ))
     
     # Avalanche C-Chain is EVM compatible, no special middleware needed
     
-    if not w3.is_connected():
-        raise ConnectionError(f"Failed to connect to RPC: {config['rpc_url']}")
+    # is_connected() costs a round-trip of its own; the chain ID read below
+    # reports an unreachable node just as well
+    if os.getenv("DEBUG_CONNECTIVITY") and not w3.is_connected():
+        raise ConnectionError(f"Failed to connect to RPC: {rpc_url}")
     
     # Verify chain ID
     try:
         chain_id = w3.eth.chain_id
+    except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+        raise ConnectionError(f"Failed to connect to RPC: {rpc_url}") from e
+    except Exception as e:
+        console.print(f"[yellow]Warning:[/yellow] Could not verify chain ID: {e}")
+    else:
         expected_chain_id = config["chain_id"]
         if chain_id != expected_chain_id:
             console.print(
                 f"[yellow]Warning:[/yellow] Connected chain ID ({chain_id}) "
                 f"does not match config ({expected_chain_id})"
             )
-    except Exception as e:
-        console.print(f"[yellow]Warning:[/yellow] Could not verify chain ID: {e}")
     
+    _CONNECTIONS[rpc_url] = w3
     return w3
 
 
@@ -225,8 +264,8 @@ def deploy_contract(
             deployments_file = Path("deployments.json")
             deployments = {}
             if deployments_file.exists():
-                with open(deployments_file) as f:
-                    deployments = json.load(f)
+                # Uncached: this dict is updated and written back below
+                deployments = load_json(deployments_file)
             
             if config['network'] not in deployments:
                 deployments[config['network']] = {}
@@ -1,16 +1,16 @@
 """Smart contract interaction module for deployed contracts."""
 
-import json
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 
 from web3 import Web3
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 
-from .compiler import get_contract_artifacts
+from .compiler import get_contract_abi
 from .deployer import get_web3_connection
+from .json_io import load_json_cached
 from .wallet import WalletManager
 
 console = Console()
@@ -24,6 +24,8 @@ class ContractInteractor:
         self.wallet = wallet
         self.w3 = get_web3_connection(config)
         self.account = wallet.get_account()
+        # contract name -> (contract, deployment info), filled on first use
+        self._contracts: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
         
     def get_deployed_contract(self, contract_name: str) -> Optional[Dict[str, Any]]:
         """Get deployed contract info from deployments.json."""
@@ -32,8 +34,7 @@ class ContractInteractor:
             console.print("[red]No deployments.json found. Deploy a contract first.[/red]")
             return None
             
-        with open(deployments_file) as f:
-            deployments = json.load(f)
+        deployments = load_json_cached(deployments_file)
             
         network = self.config["network"]
         if network not in deployments or contract_name not in deployments[network]:
@@ -44,14 +45,18 @@ class ContractInteractor:
     
     def get_contract_instance(self, contract_name: str):
         """Get Web3 contract instance for interaction."""
+        cached = self._contracts.get(contract_name)
+        if cached is not None:
+            return cached
+        
         # Get deployment info
         deployment_info = self.get_deployed_contract(contract_name)
         if not deployment_info:
             return None
             
-        # Get contract artifacts
+        # Only the ABI is needed to interact
         try:
-            artifacts = get_contract_artifacts(contract_name)
+            abi = get_contract_abi(contract_name)
         except FileNotFoundError:
             console.print(f"[red]Contract artifacts not found for {contract_name}. Compile first.[/red]")
             return None
@@ -59,9 +64,10 @@ class ContractInteractor:
         # Create contract instance
         contract = self.w3.eth.contract(
             address=deployment_info["address"],
-            abi=artifacts["abi"]
+            abi=abi
         )
         
+        self._contracts[contract_name] = (contract, deployment_info)
         return contract, deployment_info
     
     def call_view_function(self, contract_name: str, function_name: str, *args) -> Any:
@@ -100,8 +106,8 @@ class ContractInteractor:
         contract, deployment_info = result
         
         try:
-            # Get function
-            func = getattr(contract.functions, function_name)
+            # Bind the call once; it is reused for gas estimation and building
+            call = getattr(contract.functions, function_name)(*args)
             
             # Build transaction
             gas_price = self.w3.eth.gas_price
@@ -109,14 +115,14 @@ class ContractInteractor:
             
             # Estimate gas
             try:
-                gas_estimate = func(*args).estimate_gas({'from': self.account.address})
+                gas_estimate = call.estimate_gas({'from': self.account.address})
                 gas_limit = int(gas_estimate * 1.2)  # 20% buffer
             except Exception as e:
                 console.print(f"[yellow]Gas estimation failed: {e}. Using default gas limit.[/yellow]")
                 gas_limit = 200000
             
             # Build transaction
-            transaction = func(*args).build_transaction({
+            transaction = call.build_transaction({
                 'from': self.account.address,
                 'gas': gas_limit,
                 'gasPrice': gas_price,
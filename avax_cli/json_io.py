@@ -0,0 +1,50 @@
+"""Fast JSON loading for build artifacts and deployment records."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, Tuple, Union
+
+try:
+    import orjson
+    loads = orjson.loads
+except ImportError:  # orjson is optional, fall back to the stdlib parser
+    loads = json.loads
+
+PathLike = Union[str, Path]
+
+# resolved path -> (mtime_ns, parsed document); replaced when the file changes
+_CACHE: Dict[str, Tuple[int, Any]] = {}
+
+
+def load_json(path: PathLike) -> Any:
+    """Read and parse a JSON file, skipping the text decode step."""
+    with open(path, "rb") as f:
+        return loads(f.read())
+
+
+def load_json_cached(path: PathLike) -> Any:
+    """
+    Load a JSON file, reusing the parsed result while the file is unchanged.
+
+    The cache holds one entry per path and checks the modification time, so
+    a recompile or a new deployment is picked up on the next call and the
+    stale document is dropped. The returned object is shared between callers
+    and must not be mutated.
+
+    Args:
+        path: Path to the JSON file
+
+    Returns:
+        Parsed JSON document
+    """
+    file_path = Path(path).resolve()
+    cache_key = str(file_path)
+    mtime_ns = file_path.stat().st_mtime_ns
+
+    cached = _CACHE.get(cache_key)
+    if cached is not None and cached[0] == mtime_ns:
+        return cached[1]
+
+    data = load_json(file_path)
+    _CACHE[cache_key] = (mtime_ns, data)
+    return data
@@ -4,9 +4,25 @@ from typing import Any, Dict
 from dataclasses import dataclass
 
 
+def public_function(func):
+    """Decorator for public functions."""
+    func._is_public = True
+    return func
+
+
+def view_function(func):
+    """Decorator for view functions."""
+    func._is_view = True
+    return func
+
+
 class PySmartContract:
     """Enhanced base class for Python smart contracts with DeFi support."""
     
+    # Also reachable as @PySmartContract.public_function / .view_function
+    public_function = staticmethod(public_function)
+    view_function = staticmethod(view_function)
+    
     def __init__(self):
         self._state = {}
         self._storage_slots = {}
@@ -21,16 +37,6 @@ class PySmartContract:
         setattr(self, name, initial_value)
         return initial_value
     
-    def public_function(self, func):
-        """Decorator for public functions."""
-        func._is_public = True
-        return func
-    
-    def view_function(self, func):
-        """Decorator for view functions."""
-        func._is_view = True
-        return func
-    
     def event(self, name: str, *params):
         """Emit an event."""
         pass  # Events are handled during transpilation
@@ -21,6 +21,9 @@ class WalletManager:
         """Initialize wallet manager."""
         # Enable unaudited HD wallet features for account generation
         Account.enable_unaudited_hdwallet_features()
+        # Last derived account, kept only as long as this manager
+        self._account_key: Optional[str] = None
+        self._account: Optional[Account] = None
     
     def create_wallet(self, password: str, keystore_file: str = "avax_key.json") -> str:
         """
@@ -54,7 +57,7 @@ class WalletManager:
             Wallet address
         """
         private_key = self._load_encrypted_key(keystore_file, password)
-        account = Account.from_key(private_key)
+        account = self._account_from_key(private_key)
         return account.address
     
     def get_private_key(self, keystore_file: str = None, password: str = None) -> str:
@@ -109,7 +112,7 @@ class WalletManager:
         if not private_key.startswith("0x"):
             private_key = f"0x{private_key}"
         
-        account = Account.from_key(private_key)
+        account = self._account_from_key(private_key)
         return account.address
     
     def get_account(self, keystore_file: str = None, password: str = None) -> Account:
@@ -124,7 +127,14 @@ class WalletManager:
             Web3 Account object
         """
         private_key = self.get_private_key(keystore_file, password)
-        return Account.from_key(private_key)
+        return self._account_from_key(private_key)
+    
+    def _account_from_key(self, private_key: str) -> Account:
+        """Derive the account for a key, reusing it while the key is unchanged."""
+        if self._account is None or self._account_key != private_key:
+            self._account = Account.from_key(private_key)
+            self._account_key = private_key
+        return self._account
     
     def _derive_key(self, password: str, salt: bytes) -> bytes:
         """Derive encryption key from password using PBKDF2."""
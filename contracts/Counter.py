@@ -1,4 +1,4 @@
-from avax_cli.py_contracts import PySmartContract
+from avax_cli.py_contracts import PySmartContract, public_function, view_function
 
 class Counter(PySmartContract):
     """Counter contract written in Python."""
@@ -4,32 +4,180 @@ Comprehensive examples for interacting with the deployed StakeToken contract.
 This demonstrates all major functionality including minting, staking, transfers, and rewards.
 """
 
-import json
+import asyncio
+import logging
 import os
 import time
-from pathlib import Path
-from web3 import Web3
+from decimal import Decimal
+from functools import lru_cache
+from web3 import AsyncWeb3, AsyncHTTPProvider
+from web3.exceptions import BadFunctionCallOutput, ContractLogicError, InvalidAddress, TransactionNotFound
+from eth_abi.exceptions import DecodingError
 from eth_account import Account
 
+from avax_cli.json_io import load_json_cached
+
+RPC_URL = "https://api.avax-test.network/ext/bc/C/rpc"
+DEPLOYMENTS_FILE = "../my_project/deployments.json"
+ARTIFACT_FILE = "../my_project/build/StakeToken/StakeToken.json"
+
+# Poll for receipts roughly once per Fuji block instead of every 0.1s
+RECEIPT_POLL_LATENCY = 2.0
+# Seconds a fetched base fee is reused before asking the node again
+BASE_FEE_TTL = 10
+# EIP-1559 tip; effectively static on the C-Chain (2 nAVAX)
+PRIORITY_FEE = 2_000_000_000
+# Blocks to wait for staking rewards (~2s per block on Fuji)
+REWARD_WAIT_BLOCKS = 15
+# Max eth_calls per JSON-RPC batch; public Fuji RPC may cap batch size
+BATCH_SIZE = int(os.getenv("BATCH_SIZE", "8"))
+# STK uses 18 decimals
+WEI = 10**18
+
+# Canonical Multicall3 deployment (same address on Fuji and mainnet)
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+MULTICALL3_ABI = [
+    {
+        "name": "tryAggregate",
+        "type": "function",
+        "stateMutability": "payable",
+        "inputs": [
+            {"name": "requireSuccess", "type": "bool"},
+            {
+                "name": "calls",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "target", "type": "address"},
+                    {"name": "callData", "type": "bytes"}
+                ]
+            }
+        ],
+        "outputs": [
+            {
+                "name": "returnData",
+                "type": "tuple[]",
+                "components": [
+                    {"name": "success", "type": "bool"},
+                    {"name": "returnData", "type": "bytes"}
+                ]
+            }
+        ]
+    },
+    {
+        "name": "getEthBalance",
+        "type": "function",
+        "stateMutability": "view",
+        "inputs": [{"name": "addr", "type": "address"}],
+        "outputs": [{"name": "balance", "type": "uint256"}]
+    }
+]
+
+logger = logging.getLogger(__name__)
+
+RULE = "=" * 60
+
+_W3 = None
+_RECEIPTS = {}
+
+
+def get_w3():
+    """Return the process-wide async Web3 connection, creating it on first use."""
+    global _W3
+    if _W3 is None:
+        # AsyncHTTPProvider keeps a pooled keep-alive aiohttp session.
+        # HTTP is safe to use with asyncio.gather (unlike WebsocketProvider).
+        _W3 = AsyncWeb3(AsyncHTTPProvider(RPC_URL))
+    return _W3
+
+
+def to_wei(amount_tokens):
+    """Convert a token amount (int, Decimal or numeric string) to wei exactly."""
+    if isinstance(amount_tokens, int):
+        return amount_tokens * WEI
+    # Go through Decimal so fractional amounts are not rounded by float math
+    return int(Decimal(str(amount_tokens)) * WEI)
+
+
+async def _safe_call(call):
+    """Run a view call, returning (value, None) or (None, exception)."""
+    try:
+        return await call.call(), None
+    except Exception as e:
+        return None, e
+
+
+def _log_balances(title, balances, *lines, args=()):
+    """Log a block of balances as one record, formatting only if INFO is on.
+    
+    title is a %-style format string for args, like any other log message.
+    """
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(title + "\n%s", *args, "\n".join(line.format(**balances) for line in lines))
+
+
+def _check_receipt(receipt):
+    """Log whether a mined transaction succeeded."""
+    if receipt.status == 1:
+        logger.info("✅ Transaction successful!")
+        return True
+    logger.error("❌ Transaction failed!")
+    return False
+
+
+def _abi_type(param):
+    """Canonical type string of an ABI parameter, expanding tuples."""
+    abi_type = param["type"]
+    if abi_type.startswith("tuple"):
+        components = ",".join(_abi_type(c) for c in param["components"])
+        return f"({components}){abi_type[len('tuple'):]}"
+    return abi_type
+
+
+@lru_cache(maxsize=None)
+def _function_table(abi_path):
+    """Map each ABI function name to (selector hex, input types, output types)."""
+    functions = [entry for entry in load_json_cached(abi_path)["abi"] if entry.get("type") == "function"]
+    names = [entry["name"] for entry in functions]
+    table = {}
+    for entry in functions:
+        if names.count(entry["name"]) > 1:
+            continue  # Overloads are left to web3.py's resolver
+        input_types = [_abi_type(param) for param in entry["inputs"]]
+        output_types = [_abi_type(param) for param in entry["outputs"]]
+        signature = f"{entry['name']}({','.join(input_types)})"
+        table[entry["name"]] = (bytes(AsyncWeb3.keccak(text=signature)[:4]).hex(), input_types, output_types)
+    return table
+
+
+@lru_cache(maxsize=None)
+def _build_contract(w3, address, abi_path):
+    """Build the contract object once per connection, address and ABI file."""
+    return w3.eth.contract(address=address, abi=load_json_cached(abi_path)["abi"])
+
+
 class StakeTokenInteractor:
-    """Helper class for interacting with StakeToken contract."""
+    """Helper class for interacting with StakeToken contract.
+    
+    Build instances with ``await StakeTokenInteractor.create()``; the owner
+    and starting nonce are read asynchronously there.
+    """
     
-    def __init__(self):
-        # Load deployment info
-        with open("../my_project/deployments.json") as f:
-            deployments = json.load(f)
+    def __init__(self, _created=False):
+        if not _created:
+            raise TypeError("Use 'await StakeTokenInteractor.create()' to build an interactor")
+        
+        # Load deployment info (parsed once per process)
+        deployments = load_json_cached(DEPLOYMENTS_FILE)
         
         self.contract_info = deployments["fuji"]["StakeToken"]
         self.contract_address = self.contract_info["address"]
+        self.chain_id = self.contract_info.get("chain_id", 43113)
         
         # Load contract ABI
-        with open("../my_project/build/StakeToken/StakeToken.json") as f:
-            contract_data = json.load(f)
-        
-        self.abi = contract_data["abi"]
+        self.abi = load_json_cached(ARTIFACT_FILE)["abi"]
         
         # Connect to network
-        self.w3 = Web3(Web3.HTTPProvider("https://api.avax-test.network/ext/bc/C/rpc"))
+        self.w3 = get_w3()
         
         # Setup account
         private_key = os.getenv('PRIVATE_KEY')
@@ -37,250 +185,470 @@ class StakeTokenInteractor:
             raise ValueError("PRIVATE_KEY environment variable required")
         
         self.account = Account.from_key(private_key)
-        self.contract = self.w3.eth.contract(address=self.contract_address, abi=self.abi)
+        self._sign = self.account.sign_transaction
+        # Account addresses are already checksummed; keep both forms around
+        self.address = self.account.address
+        self._addr_lc = self.address.lower()
+        self.contract = _build_contract(self.w3, self.contract_address, ARTIFACT_FILE)
+        
+        # Bind contract function factories once instead of per call
+        f = self.contract.functions
+        self.fn_mint, self.fn_transfer = f.mint, f.transfer
+        self.fn_stake, self.fn_unstake = f.stake, f.unstake
+        self.fn_balanceOf, self.fn_stakedBalance, self.fn_getReward = (
+            f.balanceOf, f.stakedBalance, f.getReward
+        )
+        self.fn_owner, self.fn_rewardRate, self.fn_isPaused = f.owner, f.rewardRate, f.isPaused
+        self.fn_setRewardRate, self.fn_pause, self.fn_unpause = f.setRewardRate, f.pause, f.unpause
+        
+        # Precomputed selectors and types for encoding calls without web3.py
+        self._functions = _function_table(ARTIFACT_FILE)
+        
+        multicall = self.w3.eth.contract(address=MULTICALL3_ADDRESS, abi=MULTICALL3_ABI)
+        self.fn_tryAggregate = multicall.functions.tryAggregate
+        self.fn_getEthBalance = multicall.functions.getEthBalance
+        self._contracts = {self.contract.address: self.contract, multicall.address: multicall}
+        
+        self._owner = None
+        self._is_owner = False
+        self._nonce = None
+        
+        self._base_fee = None
+        self._base_fee_ts = 0.0
+    
+    @classmethod
+    async def create(cls):
+        """Create an interactor and read the contract owner."""
+        self = cls(_created=True)
+        
+        # Owner never changes during a run, so check it once. The nonce is
+        # tracked locally from here on and only re-read after a failed send,
+        # and the base fee is primed so the first transaction needs no reads.
+        try:
+            async with self.w3.batch_requests() as batch:
+                batch.add(self.fn_owner())
+                batch.add(self.w3.eth.get_transaction_count(self.address, 'pending'))
+                batch.add(self.w3.eth.get_block('latest'))
+                self._owner, self._nonce, latest = await batch.async_execute()
+        except Exception:
+            # Old web3.py or an endpoint that rejects batches
+            self._owner, self._nonce, latest = await asyncio.gather(
+                self.fn_owner().call(),
+                self.w3.eth.get_transaction_count(self.address, 'pending'),
+                self.w3.eth.get_block('latest')
+            )
+        self._base_fee = latest['baseFeePerGas']
+        self._base_fee_ts = time.monotonic()
+        self._is_owner = self._addr_lc == self._owner.lower()
+        
+        logger.info("🔗 Connected to StakeToken at: %s", self.contract_address)
+        logger.info("👤 Using account: %s", self.address)
+        return self
+    
+    def encode_call(self, function_call):
+        """Encode call data as hex from the selector table, falling back to web3.py."""
+        entry = None
+        if function_call.address == self.contract_address and not function_call.kwargs:
+            entry = self._functions.get(function_call.fn_name)
+        if entry is None:
+            return self._encode_abi(function_call)
+        selector, input_types, _ = entry
+        for abi_type, arg in zip(input_types, function_call.args):
+            if "address" in abi_type and abi_type != "address":
+                # Nested addresses are validated by web3.py's encoder
+                return self._encode_abi(function_call)
+            if abi_type == "address" and isinstance(arg, str) and not self.w3.is_checksum_address(arg):
+                raise InvalidAddress(
+                    "Web3.py only accepts checksum addresses; use to_checksum_address()", arg
+                )
+        return "0x" + selector + self.w3.codec.encode(input_types, function_call.args).hex()
+    
+    def _encode_abi(self, function_call):
+        """Encode call data with web3.py through the call's contract."""
+        contract = self._contracts[function_call.address]
+        return contract.encode_abi(function_call.fn_name, function_call.args, function_call.kwargs)
+    
+    async def call_view(self, name):
+        """Call a parameterless view by its precomputed selector."""
+        selector, _, output_types = self._functions[name]
+        data = await self.w3.eth.call({'to': self.contract_address, 'data': "0x" + selector})
+        return self.w3.codec.decode(output_types, data)[0]
+    
+    async def batch_call(self, *calls):
+        """Run view calls as JSON-RPC batches of at most BATCH_SIZE requests."""
+        try:
+            values = []
+            for start in range(0, len(calls), BATCH_SIZE):
+                async with self.w3.batch_requests() as batch:
+                    for call in calls[start:start + BATCH_SIZE]:
+                        batch.add(call)
+                    values.extend(await batch.async_execute())
+            return values
+        except (ContractLogicError, BadFunctionCallOutput, DecodingError):
+            # A call reverted or returned bad data; retrying it alone won't help
+            raise
+        except Exception as e:
+            # Old web3.py or an endpoint that rejects batches: issue the calls
+            # individually but concurrently over the pooled HTTP session
+            logger.warning("⚠️ Batch request failed (%s), using parallel calls", e)
+            results = await asyncio.gather(*(_safe_call(call) for call in calls))
+        
+        values = []
+        for call, (value, error) in zip(calls, results):
+            if error is not None:
+                raise RuntimeError(f"{call.fn_name}() failed: {error}") from error
+            values.append(value)
+        return values
+    
+    async def _aggregate(self, calls):
+        """Run calls through Multicall3, or return None if it is not available."""
+        requests = [(call.address, self.encode_call(call)) for call in calls]
+        try:
+            results = await self.fn_tryAggregate(False, requests).call()
+        except Exception as e:
+            logger.warning("⚠️ Multicall3 unavailable (%s), batching calls instead", e)
+            return None
         
-        print(f"🔗 Connected to StakeToken at: {self.contract_address}")
-        print(f"👤 Using account: {self.account.address}")
+        values = []
+        for call, (success, data) in zip(calls, results):
+            if not success:
+                raise RuntimeError(f"Multicall3: {call.fn_name}() reverted")
+            entry = self._functions.get(call.fn_name) if call.address == self.contract_address else None
+            if entry is not None:
+                output_types = entry[2]
+            else:
+                output_types = [_abi_type(output) for output in call.abi["outputs"]]
+            decoded = self.w3.codec.decode(output_types, data)
+            values.append(decoded[0] if len(decoded) == 1 else decoded)
+        return values
     
-    def get_balances(self):
+    async def multicall(self, *calls):
+        """Run several view calls as a single eth_call through Multicall3."""
+        values = await self._aggregate(calls)
+        if values is None:
+            values = await self.batch_call(*calls)
+        return values
+    
+    async def get_balances(self):
         """Get current balances for the account."""
-        avax_balance = self.w3.eth.get_balance(self.account.address)
-        token_balance = self.contract.functions.balanceOf(self.account.address).call()
-        staked_balance = self.contract.functions.stakedBalance(self.account.address).call()
-        reward_balance = self.contract.functions.getReward(self.account.address).call()
-        
+        address = self.address
+        token_calls = (
+            self.fn_balanceOf(address),
+            self.fn_stakedBalance(address),
+            self.fn_getReward(address)
+        )
+        
+        # AVAX balance is read through Multicall3 too, so this is one round-trip
+        values = await self._aggregate((self.fn_getEthBalance(address),) + token_calls)
+        if values is None:
+            # getEthBalance lives on Multicall3, so use plain eth_getBalance here
+            avax_balance, (token_balance, staked_balance, reward_balance) = await asyncio.gather(
+                self.w3.eth.get_balance(address),
+                self.batch_call(*token_calls)
+            )
+        else:
+            avax_balance, token_balance, staked_balance, reward_balance = values
+
         return {
             'avax': self.w3.from_wei(avax_balance, 'ether'),
-            'tokens': token_balance / 10**18,
-            'staked': staked_balance / 10**18,
-            'rewards': reward_balance / 10**18
+            'tokens': token_balance / WEI,
+            'staked': staked_balance / WEI,
+            'rewards': reward_balance / WEI
         }
     
-    def send_transaction(self, function_call, gas_limit=200000):
-        """Helper to send a transaction."""
-        nonce = self.w3.eth.get_transaction_count(self.account.address)
-        gas_price = self.w3.eth.gas_price
-        
-        tx = function_call.build_transaction({
-            'from': self.account.address,
+    async def get_fees(self):
+        """Get (maxFeePerGas, maxPriorityFeePerGas) from a base fee cached for BASE_FEE_TTL."""
+        now = time.monotonic()
+        if self._base_fee is None or now - self._base_fee_ts > BASE_FEE_TTL:
+            latest = await self.w3.eth.get_block('latest')
+            self._base_fee = latest['baseFeePerGas']
+            self._base_fee_ts = now
+        # 2x base fee leaves headroom for the base fee rising before inclusion
+        return self._base_fee * 2 + PRIORITY_FEE, PRIORITY_FEE
+    
+    async def send_transaction(self, function_call, gas_limit=200000, wait=True):
+        """Helper to send a transaction; with wait=False return the hash unconfirmed."""
+        max_fee, priority_fee = await self.get_fees()
+        
+        # Assemble the tx ourselves: every field is known locally, so there
+        # is nothing for build_transaction to fill in from the node
+        tx = {
+            'type': 2,
+            'to': self.contract_address,
+            'from': self.address,
+            'data': self.encode_call(function_call),
+            'value': 0,
             'gas': gas_limit,
-            'gasPrice': gas_price,
-            'nonce': nonce,
-            'chainId': 43113
-        })
-        
-        signed_tx = self.account.sign_transaction(tx)
-        tx_hash = self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+            'maxFeePerGas': max_fee,
+            'maxPriorityFeePerGas': priority_fee,
+            'nonce': self._nonce,
+            'chainId': self.chain_id
+        }
         
-        print(f"📤 Transaction sent: {tx_hash.hex()}")
-        receipt = self.w3.eth.wait_for_transaction_receipt(tx_hash, timeout=300)
+        signed_tx = self._sign(tx)
+        try:
+            tx_hash = await self.w3.eth.send_raw_transaction(signed_tx.raw_transaction)
+        except Exception:
+            # Local nonce may be out of sync with the node; re-read it
+            self._nonce = await self.w3.eth.get_transaction_count(self.address, 'pending')
+            raise
+        self._nonce += 1
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("📤 Transaction sent: %s", tx_hash.hex())
+        if not wait:
+            return tx_hash
+        
+        receipt = await self.wait_for_receipt(tx_hash)
+        return tx_hash if _check_receipt(receipt) else None
+    
+    async def wait_for_receipt(self, tx_hash, timeout=300):
+        """Wait for a transaction receipt, reusing it if already mined."""
+        receipt = _RECEIPTS.get(tx_hash)
+        if receipt is None:
+            receipt = await self.w3.eth.wait_for_transaction_receipt(
+                tx_hash, timeout=timeout, poll_latency=RECEIPT_POLL_LATENCY
+            )
+            _RECEIPTS[tx_hash] = receipt
+        return receipt
+    
+    async def wait_for_receipts(self, tx_hashes, timeout=300):
+        """Wait for several transactions with one polling loop, returning their receipts."""
+        pending = [tx_hash for tx_hash in tx_hashes if tx_hash not in _RECEIPTS]
+        deadline = time.monotonic() + timeout
+        
+        while pending:
+            # A JSON-RPC batch would fail as a whole on any not-yet-mined
+            # hash, so poll each pending receipt concurrently instead
+            results = await asyncio.gather(
+                *(self.w3.eth.get_transaction_receipt(tx_hash) for tx_hash in pending),
+                return_exceptions=True
+            )
+            for tx_hash, result in zip(pending, results):
+                if isinstance(result, TransactionNotFound):
+                    continue
+                if isinstance(result, Exception):
+                    raise result
+                _RECEIPTS[tx_hash] = result
+                _check_receipt(result)
+            
+            pending = [tx_hash for tx_hash in pending if tx_hash not in _RECEIPTS]
+            if pending:
+                if time.monotonic() > deadline:
+                    raise TimeoutError(f"{len(pending)} transaction(s) not mined after {timeout}s")
+                await asyncio.sleep(RECEIPT_POLL_LATENCY)
         
-        if receipt.status == 1:
-            print(f"✅ Transaction successful!")
-            return tx_hash.hex()
-        else:
-            print(f"❌ Transaction failed!")
-            return None
+        return [_RECEIPTS[tx_hash] for tx_hash in tx_hashes]
+    
+    async def wait_blocks(self, count, poll=RECEIPT_POLL_LATENCY):
+        """Wait until the chain has advanced by count blocks."""
+        start = await self.w3.eth.block_number
+        while (await self.w3.eth.block_number) - start < count:
+            await asyncio.sleep(poll)
     
-    def mint_tokens(self, amount_tokens):
+    async def mint_tokens(self, amount_tokens, wait=True):
         """Mint new tokens (owner only)."""
-        print(f"\n🪙 Minting {amount_tokens:,.0f} STK tokens...")
-        amount_wei = int(amount_tokens * 10**18)
+        logger.info("\n🪙 Minting %s STK tokens...", amount_tokens)
+        amount_wei = to_wei(amount_tokens)
         
-        owner = self.contract.functions.owner().call()
-        if self.account.address.lower() != owner.lower():
-            print(f"❌ Only owner can mint tokens")
+        if not self._is_owner:
+            logger.warning("❌ Only owner can mint tokens")
             return None
         
-        return self.send_transaction(self.contract.functions.mint(amount_wei))
+        return await self.send_transaction(self.fn_mint(amount_wei), wait=wait)
     
-    def transfer_tokens(self, to_address, amount_tokens):
+    async def transfer_tokens(self, to_address, amount_tokens, wait=True):
         """Transfer tokens to another address."""
-        print(f"\n💸 Transferring {amount_tokens:,.2f} STK to {to_address}...")
-        amount_wei = int(amount_tokens * 10**18)
+        logger.info("\n💸 Transferring %s STK to %s...", amount_tokens, to_address)
+        amount_wei = to_wei(amount_tokens)
         
-        return self.send_transaction(self.contract.functions.transfer(to_address, amount_wei))
+        return await self.send_transaction(self.fn_transfer(to_address, amount_wei), wait=wait)
     
-    def stake_tokens(self, amount_tokens):
+    async def stake_tokens(self, amount_tokens):
         """Stake tokens to earn rewards."""
-        print(f"\n🔒 Staking {amount_tokens:,.2f} STK tokens...")
-        amount_wei = int(amount_tokens * 10**18)
+        logger.info("\n🔒 Staking %s STK tokens...", amount_tokens)
+        amount_wei = to_wei(amount_tokens)
         
-        return self.send_transaction(self.contract.functions.stake(amount_wei))
+        return await self.send_transaction(self.fn_stake(amount_wei))
     
-    def unstake_tokens(self, amount_tokens):
+    async def unstake_tokens(self, amount_tokens):
         """Unstake tokens and claim rewards."""
-        print(f"\n🔓 Unstaking {amount_tokens:,.2f} STK tokens...")
-        amount_wei = int(amount_tokens * 10**18)
+        logger.info("\n🔓 Unstaking %s STK tokens...", amount_tokens)
+        amount_wei = to_wei(amount_tokens)
         
-        return self.send_transaction(self.contract.functions.unstake(amount_wei))
+        return await self.send_transaction(self.fn_unstake(amount_wei))
     
-    def set_reward_rate(self, new_rate):
+    async def set_reward_rate(self, new_rate):
         """Set new reward rate (owner only)."""
-        print(f"\n⚙️ Setting reward rate to {new_rate}%...")
+        logger.info("\n⚙️ Setting reward rate to %s%%...", new_rate)
         
-        owner = self.contract.functions.owner().call()
-        if self.account.address.lower() != owner.lower():
-            print(f"❌ Only owner can set reward rate")
+        if not self._is_owner:
+            logger.warning("❌ Only owner can set reward rate")
             return None
         
-        return self.send_transaction(self.contract.functions.setRewardRate(new_rate))
+        return await self.send_transaction(self.fn_setRewardRate(new_rate))
     
-    def pause_contract(self):
+    async def pause_contract(self):
         """Pause the contract (owner only)."""
-        print(f"\n⏸️ Pausing contract...")
+        logger.info("\n⏸️ Pausing contract...")
         
-        owner = self.contract.functions.owner().call()
-        if self.account.address.lower() != owner.lower():
-            print(f"❌ Only owner can pause contract")
+        if not self._is_owner:
+            logger.warning("❌ Only owner can pause contract")
             return None
         
-        return self.send_transaction(self.contract.functions.pause())
+        return await self.send_transaction(self.fn_pause())
     
-    def unpause_contract(self):
+    async def unpause_contract(self):
         """Unpause the contract (owner only)."""
-        print(f"\n▶️ Unpausing contract...")
+        logger.info("\n▶️ Unpausing contract...")
         
-        owner = self.contract.functions.owner().call()
-        if self.account.address.lower() != owner.lower():
-            print(f"❌ Only owner can unpause contract")
+        if not self._is_owner:
+            logger.warning("❌ Only owner can unpause contract")
             return None
         
-        return self.send_transaction(self.contract.functions.unpause())
+        return await self.send_transaction(self.fn_unpause())
 
 
-def example_1_basic_operations():
+async def example_1_basic_operations(interactor):
     """Example 1: Basic token operations."""
-    print("=" * 60)
-    print("📋 EXAMPLE 1: Basic Token Operations")
-    print("=" * 60)
-    
-    interactor = StakeTokenInteractor()
+    logger.info("%s\n📋 EXAMPLE 1: Basic Token Operations\n%s", RULE, RULE)
     
     # Check initial balances
-    print("\n📊 Initial Balances:")
-    balances = interactor.get_balances()
-    print(f"   AVAX: {balances['avax']:.4f}")
-    print(f"   STK Tokens: {balances['tokens']:,.2f}")
-    print(f"   Staked: {balances['staked']:,.2f}")
-    print(f"   Rewards: {balances['rewards']:,.6f}")
-    
-    # Mint some tokens (if owner)
-    interactor.mint_tokens(500)
+    balances = await interactor.get_balances()
+    _log_balances(
+        "\n📊 Initial Balances:", balances,
+        "   AVAX: {avax:.4f}",
+        "   STK Tokens: {tokens:,.2f}",
+        "   Staked: {staked:,.2f}",
+        "   Rewards: {rewards:,.6f}"
+    )
     
-    # Transfer some tokens
+    # Mint some tokens (if owner) and transfer some. Both go out back to back
+    # with consecutive nonces and are confirmed by a single polling loop.
     burn_address = "0x000000000000000000000000000000000000dEaD"
-    interactor.transfer_tokens(burn_address, 10)
+    tx_hashes = [
+        await interactor.mint_tokens(500, wait=False),
+        await interactor.transfer_tokens(burn_address, 10, wait=False)
+    ]
+    await interactor.wait_for_receipts([tx_hash for tx_hash in tx_hashes if tx_hash])
     
     # Check final balances
-    print("\n📊 Final Balances:")
-    balances = interactor.get_balances()
-    print(f"   STK Tokens: {balances['tokens']:,.2f}")
-    print(f"   Staked: {balances['staked']:,.2f}")
-    print(f"   Rewards: {balances['rewards']:,.6f}")
+    balances = await interactor.get_balances()
+    _log_balances(
+        "\n📊 Final Balances:", balances,
+        "   STK Tokens: {tokens:,.2f}",
+        "   Staked: {staked:,.2f}",
+        "   Rewards: {rewards:,.6f}"
+    )
+    return balances
 
 
-def example_2_staking_workflow():
+async def example_2_staking_workflow(interactor, balances=None):
     """Example 2: Complete staking workflow."""
-    print("\n" + "=" * 60)
-    print("🔒 EXAMPLE 2: Staking Workflow")
-    print("=" * 60)
+    logger.info("\n%s\n🔒 EXAMPLE 2: Staking Workflow\n%s", RULE, RULE)
     
-    interactor = StakeTokenInteractor()
-    
-    # Check balances before staking
-    print("\n📊 Before Staking:")
-    balances = interactor.get_balances()
-    print(f"   Available Tokens: {balances['tokens']:,.2f} STK")
-    print(f"   Currently Staked: {balances['staked']:,.2f} STK")
+    # Check balances before staking (reuse the caller's fresh read if given)
+    if balances is None:
+        balances = await interactor.get_balances()
+    _log_balances(
+        "\n📊 Before Staking:", balances,
+        "   Available Tokens: {tokens:,.2f} STK",
+        "   Currently Staked: {staked:,.2f} STK"
+    )
     
     # Stake some tokens
     if balances['tokens'] >= 100:
-        interactor.stake_tokens(100)
+        await interactor.stake_tokens(100)
         
-        # Wait a moment to accumulate some rewards
-        print("\n⏳ Waiting 30 seconds to accumulate rewards...")
-        time.sleep(30)
+        # Wait for a few blocks to accumulate some rewards
+        logger.info("\n⏳ Waiting %d blocks to accumulate rewards...", REWARD_WAIT_BLOCKS)
+        await interactor.wait_blocks(REWARD_WAIT_BLOCKS)
         
         # Check rewards
-        balances = interactor.get_balances()
-        print(f"\n🎁 Rewards after 30 seconds: {balances['rewards']:,.6f} STK")
+        balances = await interactor.get_balances()
+        _log_balances(
+            "\n🎁 Rewards after %d blocks:", balances,
+            "   {rewards:,.6f} STK",
+            args=(REWARD_WAIT_BLOCKS,)
+        )
         
         # Unstake half
-        interactor.unstake_tokens(50)
+        await interactor.unstake_tokens(50)
         
         # Check final state
-        print("\n📊 After Partial Unstaking:")
-        balances = interactor.get_balances()
-        print(f"   Available Tokens: {balances['tokens']:,.2f} STK")
-        print(f"   Still Staked: {balances['staked']:,.2f} STK")
-        print(f"   Remaining Rewards: {balances['rewards']:,.6f} STK")
+        balances = await interactor.get_balances()
+        _log_balances(
+            "\n📊 After Partial Unstaking:", balances,
+            "   Available Tokens: {tokens:,.2f} STK",
+            "   Still Staked: {staked:,.2f} STK",
+            "   Remaining Rewards: {rewards:,.6f} STK"
+        )
     else:
-        print("❌ Not enough tokens to demonstrate staking")
+        logger.warning("❌ Not enough tokens to demonstrate staking")
 
 
-def example_3_admin_functions():
+async def example_3_admin_functions(interactor):
     """Example 3: Admin functions (owner only)."""
-    print("\n" + "=" * 60)
-    print("⚙️ EXAMPLE 3: Admin Functions")
-    print("=" * 60)
-    
-    interactor = StakeTokenInteractor()
+    logger.info("\n%s\n⚙️ EXAMPLE 3: Admin Functions\n%s", RULE, RULE)
     
     # Check if we're the owner
-    owner = interactor.contract.functions.owner().call()
-    is_owner = interactor.account.address.lower() == owner.lower()
+    owner = interactor._owner
+    is_owner = interactor._is_owner
     
-    print(f"\n👤 Contract Owner: {owner}")
-    print(f"👤 Current Account: {interactor.account.address}")
-    print(f"🔑 Is Owner: {is_owner}")
+    logger.info(
+        "\n👤 Contract Owner: %s\n👤 Current Account: %s\n🔑 Is Owner: %s",
+        owner, interactor.address, is_owner
+    )
     
     if is_owner:
-        # Change reward rate
-        current_rate = interactor.contract.functions.rewardRate().call()
-        print(f"\n📊 Current reward rate: {current_rate}%")
+        # Read the current rate and pause state in one call
+        current_rate, is_paused = await interactor.multicall(
+            interactor.fn_rewardRate(),
+            interactor.fn_isPaused()
+        )
+        logger.info("\n📊 Current reward rate: %s%%", current_rate)
         
         # Set new rate
-        interactor.set_reward_rate(15)
+        await interactor.set_reward_rate(15)
         
         # Verify change
-        new_rate = interactor.contract.functions.rewardRate().call()
-        print(f"📊 New reward rate: {new_rate}%")
+        new_rate = await interactor.call_view("rewardRate")
+        logger.info("📊 New reward rate: %s%%", new_rate)
         
         # Test pause/unpause
-        is_paused = interactor.contract.functions.isPaused().call()
-        print(f"\n⏸️ Contract paused: {is_paused}")
+        logger.info("\n⏸️ Contract paused: %s", is_paused)
         
         if not is_paused:
-            interactor.pause_contract()
-            is_paused = interactor.contract.functions.isPaused().call()
-            print(f"⏸️ Contract paused: {is_paused}")
+            await interactor.pause_contract()
+            is_paused = await interactor.call_view("isPaused")
+            logger.info("⏸️ Contract paused: %s", is_paused)
             
-            interactor.unpause_contract()
-            is_paused = interactor.contract.functions.isPaused().call()
-            print(f"▶️ Contract paused: {is_paused}")
+            await interactor.unpause_contract()
+            is_paused = await interactor.call_view("isPaused")
+            logger.info("▶️ Contract paused: %s", is_paused)
     else:
-        print("⚠️ Admin functions require owner privileges")
+        logger.warning("⚠️ Admin functions require owner privileges")
 
 
-def main():
+async def main():
     """Run all examples."""
-    print("🚀 StakeToken Contract Interaction Examples")
-    print("🌐 Network: Avalanche Fuji Testnet")
+    logger.info("🚀 StakeToken Contract Interaction Examples\n🌐 Network: Avalanche Fuji Testnet")
     
     try:
-        # Run examples
-        example_1_basic_operations()
-        example_2_staking_workflow()
-        example_3_admin_functions()
+        # One interactor for all examples: owner and nonce are read once
+        interactor = await StakeTokenInteractor.create()
+        
+        # Nothing changes between example 1's final read and example 2's start
+        balances = await example_1_basic_operations(interactor)
+        await example_2_staking_workflow(interactor, balances)
+        await example_3_admin_functions(interactor)
         
-        print("\n" + "=" * 60)
-        print("✅ All examples completed successfully!")
-        print("=" * 60)
+        logger.info("\n%s\n✅ All examples completed successfully!\n%s", RULE, RULE)
         
     except Exception as e:
-        print(f"\n❌ Error running examples: {e}")
+        logger.error("\n❌ Error running examples: %s", e)
 
 
 if __name__ == "__main__":
-    main()
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    asyncio.run(main())
@@ -3,7 +3,7 @@ DeFiContract - Enhanced DeFi savings pool in Python
 Compatible with complex DeFi applications!
 """
 
-from avax_cli.py_contracts import PySmartContract
+from avax_cli.py_contracts import PySmartContract, public_function, view_function
 
 class Defi(PySmartContract):
     """Enhanced DeFi savings pool with proper address handling and mapping support."""
@@ -96,18 +96,23 @@ class Defi(PySmartContract):
     
     def _apply_interest(self, user: str):
         """Internal: apply interest for a user before updating balances."""
-        stored = self.balances.get(user, 0)
+        # Private helpers are not transpiled, so state read more than once
+        # (both mappings and the block number) can live in locals
+        balances = self.balances
+        last_update = self.last_update
+        current_block = self.block_number()
+        stored = balances.get(user, 0)
         if stored == 0:
-            self.last_update[user] = self.block_number()
+            last_update[user] = current_block
             return
         
-        last = self.last_update.get(user, self.block_number())
-        blocks_passed = self.block_number() - last
+        last = last_update.get(user, current_block)
+        blocks_passed = current_block - last
         if blocks_passed > 0:
             # Interest accumulation using basis points
             interest = stored * self.interest_rate * blocks_passed // 100000
             if interest > 0:
-                self.balances[user] = stored + interest
+                balances[user] = stored + interest
                 self.total_deposits = self.total_deposits + interest
                 self.event("InterestApplied", user, interest)
-            self.last_update[user] = self.block_number()
+            last_update[user] = current_block
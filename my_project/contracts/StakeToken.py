@@ -9,7 +9,7 @@ ERC-20 style token in Python with:
 - Dynamic reward rate adjustment
 """
 
-from avax_cli.py_contracts import PySmartContract
+from avax_cli.py_contracts import PySmartContract, public_function, view_function
 
 class StakeToken(PySmartContract):
     def __init__(self):
@@ -53,6 +53,9 @@ class StakeToken(PySmartContract):
     def get_total_supply(self) -> int:
         return self.total_supply
 
+    # balance_of / stake_of / reward_of stay as plain if/else: the transpiler
+    # compiles branches to JUMPI, but a dict-of-lambdas dispatch table would
+    # compile to a constant 0 and add an extra storage slot.
     @view_function
     def balance_of(self, account: int) -> int:
         if account == 1:  # Owner
@@ -20,6 +20,9 @@ setup(
         "cryptography>=41.0.0",
         "requests>=2.31.0",
     ],
+    extras_require={
+        "fast": ["orjson>=3.10"],
+    },
     entry_points={
         "console_scripts": [
             "avax-cli=avax_cli.cli:main",
@@ -1,4 +1,4 @@
-from avax_cli.py_contracts import PySmartContract
+from avax_cli.py_contracts import PySmartContract, public_function, view_function
 
 class SimpleStorage(PySmartContract):
     """Simple storage contract written in Python."""
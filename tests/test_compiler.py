@@ -0,0 +1,24 @@
+"""Tests for loading compiled contract artifacts."""
+
+import json
+
+import pytest
+
+from avax_cli.compiler import get_contract_abi
+
+ABI = [{"type": "function", "name": "get", "inputs": [], "outputs": [{"type": "uint256"}]}]
+
+
+def test_get_contract_abi_reads_abi_file(tmp_path):
+    contract_dir = tmp_path / "SimpleStorage"
+    contract_dir.mkdir()
+    (contract_dir / "SimpleStorage_abi.json").write_text(json.dumps(ABI))
+    # The full artifact is not needed for the ABI
+    (contract_dir / "SimpleStorage.json").write_text("not json")
+
+    assert get_contract_abi("SimpleStorage", tmp_path) == ABI
+
+
+def test_get_contract_abi_missing(tmp_path):
+    with pytest.raises(FileNotFoundError, match="Run 'avax-cli compile' first"):
+        get_contract_abi("SimpleStorage", tmp_path)
@@ -0,0 +1,56 @@
+"""Tests for the cached JSON loader."""
+
+import json
+import os
+
+import pytest
+
+from avax_cli import json_io
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    json_io._CACHE.clear()
+    yield
+    json_io._CACHE.clear()
+
+
+def write_json(path, data, mtime_ns):
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_load_json(tmp_path):
+    path = tmp_path / "deployments.json"
+    write_json(path, {"fuji": {"StakeToken": {"address": "0x01"}}}, 10**18)
+
+    assert json_io.load_json(path) == {"fuji": {"StakeToken": {"address": "0x01"}}}
+
+
+class TestLoadJsonCached:
+    def test_reuses_parsed_document(self, tmp_path):
+        path = tmp_path / "Token.json"
+        write_json(path, {"abi": []}, 10**18)
+
+        assert json_io.load_json_cached(path) is json_io.load_json_cached(str(path))
+
+    def test_reloads_when_mtime_changes(self, tmp_path):
+        path = tmp_path / "Token.json"
+        write_json(path, {"abi": [{"name": "old"}]}, 10**18)
+        assert json_io.load_json_cached(path)["abi"] == [{"name": "old"}]
+
+        write_json(path, {"abi": [{"name": "new"}]}, 2 * 10**18)
+        assert json_io.load_json_cached(path)["abi"] == [{"name": "new"}]
+
+    def test_replaces_stale_entry(self, tmp_path):
+        path = tmp_path / "Token.json"
+        for mtime_ns in (10**18, 2 * 10**18, 3 * 10**18):
+            write_json(path, {"abi": []}, mtime_ns)
+            json_io.load_json_cached(path)
+
+        assert list(json_io._CACHE) == [str(path.resolve())]
+        assert json_io._CACHE[str(path.resolve())][0] == 3 * 10**18
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            json_io.load_json_cached(tmp_path / "missing.json")